@@ -0,0 +1,66 @@
+import os
+from logging import getLogger
+from typing import Optional, cast
+
+import redis
+
+logger = getLogger(__name__)
+
+# Caching is optional: without APP_REDIS_URL every lookup goes straight to the database.
+REDIS_URL = os.environ.get("APP_REDIS_URL")
+DEFAULT_TTL = 300
+
+_client: Optional[redis.Redis] = None
+
+
+def get_client() -> Optional[redis.Redis]:
+    """Shared Redis client, or None when no Redis is configured."""
+    global _client
+    if _client is None and REDIS_URL:
+        _client = redis.Redis.from_url(REDIS_URL, socket_timeout=0.5, socket_connect_timeout=0.5)
+    return _client
+
+
+def set_client(client: Optional[redis.Redis]) -> None:
+    """Replace the shared Redis client, e.g. with an in-memory one in tests; None goes back to APP_REDIS_URL."""
+    global _client
+    _client = client
+
+
+def post_key(slug: str) -> str:
+    return f"post:slug:{slug}"
+
+
+def page_key(slug: str) -> str:
+    return f"page:slug:{slug}"
+
+
+def cache_get(key: str) -> Optional[bytes]:
+    client = get_client()
+    if client is None:
+        return None
+    try:
+        return cast(Optional[bytes], client.get(key))
+    except redis.RedisError as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return None
+
+
+def cache_set(key: str, value: str, ttl: int = DEFAULT_TTL) -> None:
+    client = get_client()
+    if client is None:
+        return
+    try:
+        client.setex(key, ttl, value)
+    except redis.RedisError as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+
+
+def cache_delete(*keys: str) -> None:
+    client = get_client()
+    if client is None or not keys:
+        return
+    try:
+        client.delete(*keys)
+    except redis.RedisError as e:
+        logger.warning(f"Cache invalidation failed for {keys}: {e}")
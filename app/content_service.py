@@ -0,0 +1,343 @@
+from datetime import datetime
+from typing import List, Optional, TypeVar
+
+from pydantic import TypeAdapter
+from sqlalchemy import func, literal
+from sqlalchemy.orm import defer, joinedload, raiseload, selectinload
+from sqlmodel import Session, asc, col, desc, select
+
+from app.cache import cache_delete, cache_get, cache_set, page_key, post_key
+from app.database import get_session
+from app.loading import attr, strict
+from app.models import (
+    Category,
+    CategoryCreate,
+    CategoryResponse,
+    CategoryUpdate,
+    ContentStatus,
+    Page,
+    PageCreate,
+    PageResponse,
+    PageUpdate,
+    Post,
+    PostCreate,
+    PostResponse,
+    PostUpdate,
+    Tag,
+    TagCreate,
+    TagResponse,
+    TagUpdate,
+    utcnow,
+)
+from app.view_counts import pending_post_views
+
+CATEGORIES_CACHE_KEY = "categories:all"
+TAGS_CACHE_KEY = "tags:all"
+
+_category_list = TypeAdapter(List[CategoryResponse])
+_tag_list = TypeAdapter(List[TagResponse])
+
+# parent_id chains are not checked for cycles on write: recursive queries stop at this depth and
+# report every row once, so a cycle yields a bounded result instead of running into the statement timeout.
+MAX_TREE_DEPTH = 32
+
+ModelT = TypeVar("ModelT", Post, Page, Category, Tag)
+
+
+def _reload(session: Session, model: type[ModelT], obj_id: int) -> ModelT:
+    """Re-read a row after commit without triggering its eager relationship loads."""
+    return session.exec(strict(select(model).where(model.id == obj_id))).one()
+
+
+def list_published_posts(limit: int = 50) -> List[Post]:
+    """Published posts, newest first, with author, category and tags loaded.
+
+    Listings only need short columns: bodies and descriptions are left out of the rows and raise if accessed.
+    """
+    with get_session() as session:
+        stmt = strict(
+            select(Post).where(Post.status == ContentStatus.PUBLISHED).order_by(desc(Post.published_at)).limit(limit),
+            defer(attr(Post.content), raiseload=True),
+            joinedload(attr(Post.author)).raiseload("*"),
+            joinedload(attr(Post.category)).options(defer(attr(Category.description), raiseload=True), raiseload("*")),
+            selectinload(attr(Post.tags)).options(defer(attr(Tag.description), raiseload=True), raiseload("*")),
+        )
+        return list(session.exec(stmt).all())
+
+
+def list_published_pages(limit: int = 50) -> List[Page]:
+    """Published pages, newest first, with author, category and tags loaded.
+
+    Listings only need short columns: bodies and descriptions are left out of the rows and raise if accessed.
+    """
+    with get_session() as session:
+        stmt = strict(
+            select(Page).where(Page.status == ContentStatus.PUBLISHED).order_by(desc(Page.published_at)).limit(limit),
+            defer(attr(Page.content), raiseload=True),
+            joinedload(attr(Page.author)).raiseload("*"),
+            joinedload(attr(Page.category)).options(defer(attr(Category.description), raiseload=True), raiseload("*")),
+            selectinload(attr(Page.tags)).options(defer(attr(Tag.description), raiseload=True), raiseload("*")),
+        )
+        return list(session.exec(stmt).all())
+
+
+def _fetch_post_by_slug(slug: str) -> Optional[PostResponse]:
+    cached = cache_get(post_key(slug))
+    if cached is not None:
+        return PostResponse.model_validate_json(cached)
+
+    with get_session() as session:
+        post = session.exec(
+            strict(select(Post).where(Post.slug == slug, Post.status == ContentStatus.PUBLISHED))
+        ).first()
+        if post is None:
+            return None
+        response = PostResponse.model_validate(post)
+
+    cache_set(post_key(slug), response.model_dump_json())
+    return response
+
+
+def get_post_by_slug(slug: str) -> Optional[PostResponse]:
+    """Published post by slug, served from the cache when possible, including views not yet flushed to the database."""
+    response = _fetch_post_by_slug(slug)
+    if response is None:
+        return None
+    pending = pending_post_views(response.id)
+    if pending == 0:
+        return response
+    return response.model_copy(update={"view_count": response.view_count + pending})
+
+
+def get_page_by_slug(slug: str) -> Optional[PageResponse]:
+    """Published page by slug, served from the cache when possible."""
+    cached = cache_get(page_key(slug))
+    if cached is not None:
+        return PageResponse.model_validate_json(cached)
+
+    with get_session() as session:
+        page = session.exec(
+            strict(select(Page).where(Page.slug == slug, Page.status == ContentStatus.PUBLISHED))
+        ).first()
+        if page is None:
+            return None
+        response = PageResponse.model_validate(page)
+
+    cache_set(page_key(slug), response.model_dump_json())
+    return response
+
+
+def invalidate_categories() -> None:
+    """Drop the cached category list; call after every write to categories."""
+    cache_delete(CATEGORIES_CACHE_KEY)
+
+
+def invalidate_tags() -> None:
+    """Drop the cached tag list; call after every write to tags."""
+    cache_delete(TAGS_CACHE_KEY)
+
+
+def list_categories() -> List[CategoryResponse]:
+    """All categories ordered by name, served from the cache when possible."""
+    cached = cache_get(CATEGORIES_CACHE_KEY)
+    if cached is not None:
+        return _category_list.validate_json(cached)
+
+    with get_session() as session:
+        categories = session.exec(strict(select(Category).order_by(Category.name))).all()
+        response = [CategoryResponse.model_validate(category) for category in categories]
+
+    cache_set(CATEGORIES_CACHE_KEY, _category_list.dump_json(response).decode())
+    return response
+
+
+def list_tags() -> List[TagResponse]:
+    """All tags ordered by name, served from the cache when possible."""
+    cached = cache_get(TAGS_CACHE_KEY)
+    if cached is not None:
+        return _tag_list.validate_json(cached)
+
+    with get_session() as session:
+        tags = session.exec(strict(select(Tag).order_by(Tag.name))).all()
+        response = [TagResponse.model_validate(tag) for tag in tags]
+
+    cache_set(TAGS_CACHE_KEY, _tag_list.dump_json(response).decode())
+    return response
+
+
+def create_category(data: CategoryCreate, created_by_id: int) -> CategoryResponse:
+    """Create a category and drop the cached category list."""
+    with get_session() as session:
+        category = Category(**data.model_dump(), created_by_id=created_by_id)
+        session.add(category)
+        session.flush()
+        category_id = category.id
+        assert category_id is not None
+        session.commit()
+        response = CategoryResponse.model_validate(_reload(session, Category, category_id))
+
+    invalidate_categories()
+    return response
+
+
+def update_category(category_id: int, data: CategoryUpdate) -> Optional[CategoryResponse]:
+    """Apply a partial update to a category and drop the cached category list."""
+    with get_session() as session:
+        category = session.exec(strict(select(Category).where(Category.id == category_id))).first()
+        if category is None:
+            return None
+        for key, value in data.model_dump(exclude_unset=True).items():
+            setattr(category, key, value)
+
+        session.add(category)
+        session.commit()
+        response = CategoryResponse.model_validate(_reload(session, Category, category_id))
+
+    invalidate_categories()
+    return response
+
+
+def create_tag(data: TagCreate) -> TagResponse:
+    """Create a tag and drop the cached tag list."""
+    with get_session() as session:
+        tag = Tag(**data.model_dump())
+        session.add(tag)
+        session.flush()
+        tag_id = tag.id
+        assert tag_id is not None
+        session.commit()
+        response = TagResponse.model_validate(_reload(session, Tag, tag_id))
+
+    invalidate_tags()
+    return response
+
+
+def update_tag(tag_id: int, data: TagUpdate) -> Optional[TagResponse]:
+    """Apply a partial update to a tag and drop the cached tag list."""
+    with get_session() as session:
+        tag = session.exec(strict(select(Tag).where(Tag.id == tag_id))).first()
+        if tag is None:
+            return None
+        for key, value in data.model_dump(exclude_unset=True).items():
+            setattr(tag, key, value)
+
+        session.add(tag)
+        session.commit()
+        response = TagResponse.model_validate(_reload(session, Tag, tag_id))
+
+    invalidate_tags()
+    return response
+
+
+def create_post(data: PostCreate, author_id: int) -> PostResponse:
+    """Create a post and attach its tags, looked up with a single query."""
+    with get_session() as session:
+        post = Post(**data.model_dump(exclude={"tag_ids"}), author_id=author_id)
+        post.tags = Tag.multiple_from_ids(session, data.tag_ids)
+        if post.status == ContentStatus.PUBLISHED:
+            post.published_at = datetime.utcnow()
+
+        session.add(post)
+        session.flush()
+        post_id = post.id
+        assert post_id is not None
+        session.commit()
+        return PostResponse.model_validate(_reload(session, Post, post_id))
+
+
+def create_page(data: PageCreate, author_id: int) -> PageResponse:
+    """Create a page and attach its tags, looked up with a single query."""
+    with get_session() as session:
+        page = Page(**data.model_dump(exclude={"tag_ids"}), author_id=author_id)
+        page.tags = Tag.multiple_from_ids(session, data.tag_ids)
+        if page.status == ContentStatus.PUBLISHED:
+            page.published_at = datetime.utcnow()
+
+        session.add(page)
+        session.flush()
+        page_id = page.id
+        assert page_id is not None
+        session.commit()
+        return PageResponse.model_validate(_reload(session, Page, page_id))
+
+
+def update_post(post_id: int, data: PostUpdate) -> Optional[PostResponse]:
+    """Apply a partial update to a post and drop its cached entries."""
+    with get_session() as session:
+        post = session.exec(strict(select(Post).where(Post.id == post_id), selectinload(attr(Post.tags)))).first()
+        if post is None:
+            return None
+        old_slug = post.slug
+
+        for key, value in data.model_dump(exclude_unset=True, exclude={"tag_ids"}).items():
+            setattr(post, key, value)
+        if data.tag_ids is not None:
+            post.tags = Tag.multiple_from_ids(session, data.tag_ids)
+        # bump the timestamp even when only the tag links changed
+        post.updated_at = utcnow()  # type: ignore[assignment]
+
+        session.add(post)
+        session.commit()
+        response = PostResponse.model_validate(_reload(session, Post, post_id))
+
+    cache_delete(post_key(old_slug), post_key(response.slug))
+    return response
+
+
+def update_page(page_id: int, data: PageUpdate) -> Optional[PageResponse]:
+    """Apply a partial update to a page and drop its cached entries."""
+    with get_session() as session:
+        page = session.exec(strict(select(Page).where(Page.id == page_id), selectinload(attr(Page.tags)))).first()
+        if page is None:
+            return None
+        old_slug = page.slug
+
+        for key, value in data.model_dump(exclude_unset=True, exclude={"tag_ids"}).items():
+            setattr(page, key, value)
+        if data.tag_ids is not None:
+            page.tags = Tag.multiple_from_ids(session, data.tag_ids)
+        # bump the timestamp even when only the tag links changed
+        page.updated_at = utcnow()  # type: ignore[assignment]
+
+        session.add(page)
+        session.commit()
+        response = PageResponse.model_validate(_reload(session, Page, page_id))
+
+    cache_delete(page_key(old_slug), page_key(response.slug))
+    return response
+
+
+def category_ancestors(category_id: int) -> List[Category]:
+    """The category and all of its ancestors, root first, fetched with one recursive query."""
+    with get_session() as session:
+        chain = (
+            select(col(Category.id), col(Category.parent_id), literal(0).label("depth"))
+            .where(Category.id == category_id)
+            .cte("category_chain", recursive=True)
+        )
+        chain = chain.union_all(
+            select(col(Category.id), col(Category.parent_id), chain.c.depth + 1)
+            .join(chain, col(Category.id) == chain.c.parent_id)
+            .where(chain.c.depth < MAX_TREE_DEPTH)
+        )
+        levels = select(chain.c.id, func.min(chain.c.depth).label("depth")).group_by(chain.c.id).subquery()
+        stmt = strict(select(Category).join(levels, col(Category.id) == levels.c.id).order_by(desc(levels.c.depth)))
+        return list(session.exec(stmt).all())
+
+
+def page_subtree(page_id: int) -> List[Page]:
+    """The page and all of its descendants, level by level in menu order, fetched with one recursive query."""
+    with get_session() as session:
+        tree = (
+            select(col(Page.id), literal(0).label("depth")).where(Page.id == page_id).cte("page_tree", recursive=True)
+        )
+        tree = tree.union_all(
+            select(col(Page.id), tree.c.depth + 1)
+            .join(tree, col(Page.parent_id) == tree.c.id)
+            .where(tree.c.depth < MAX_TREE_DEPTH)
+        )
+        levels = select(tree.c.id, func.min(tree.c.depth).label("depth")).group_by(tree.c.id).subquery()
+        stmt = strict(
+            select(Page).join(levels, col(Page.id) == levels.c.id).order_by(asc(levels.c.depth), asc(Page.sort_order))
+        )
+        return list(session.exec(stmt).all())
@@ -0,0 +1,25 @@
+from typing import Any, TypeVar, cast
+
+from sqlalchemy.orm import QueryableAttribute, raiseload
+from sqlalchemy.orm.interfaces import LoaderOption
+from sqlmodel.sql.expression import SelectOfScalar
+
+T = TypeVar("T")
+
+
+def strict(stmt: SelectOfScalar[T], *loads: LoaderOption) -> SelectOfScalar[T]:
+    """Apply the given loader options and make every other relationship raise on access.
+
+    Accidental access to a relationship that was not explicitly loaded fails loudly
+    instead of silently issuing one query per row.
+    """
+    return stmt.options(*loads, raiseload("*"))
+
+
+def attr(attribute: Any) -> QueryableAttribute[Any]:
+    """Type a model attribute for use in loader options.
+
+    SQLModel annotates class attributes with their instance types (``Post.author`` is a ``User``),
+    while at runtime they are the instrumented attributes that joinedload() and friends expect.
+    """
+    return cast(QueryableAttribute[Any], attribute)
@@ -1,8 +1,40 @@
-from sqlmodel import SQLModel, Field, Relationship, JSON, Column
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlmodel import SQLModel, Field, Relationship, JSON, Column, Index, Session, col, select
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
 
+from app.loading import strict
+
+# Shared email pattern. Pydantic compiles it once per schema into its Rust regex engine,
+# which matches in linear time regardless of input shape.
+EMAIL_PATTERN = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
+
+
+# Database-side UTC timestamp: timestamps are filled in by the database instead of a
+# datetime.utcnow() call per row, while keeping the naive-UTC values the app has always stored.
+# Databases created before these server defaults need them added by hand, see README.md.
+class UtcNow(FunctionElement):
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(UtcNow, "postgresql")
+def _pg_utcnow(element, compiler, **kw) -> str:
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(UtcNow)
+def _default_utcnow(element, compiler, **kw) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+def utcnow() -> UtcNow:
+    """SQL expression for the current UTC time, evaluated by the database."""
+    return UtcNow()
+
 
 # Enums for role and content status
 class UserRole(str, Enum):
@@ -17,19 +49,22 @@ class ContentStatus(str, Enum):
 
 
 # Association table for many-to-many relationship between posts and tags
+# Note: selectin loads through link tables keep the join back to the parent table. Do not set
+# omit_join=True on these relationships - SQLAlchemy does not support it for secondary tables
+# and emits a cartesian product between the link table and the target table.
 class PostTagLink(SQLModel, table=True):
     __tablename__ = "post_tag_links"  # type: ignore[assignment]
 
-    post_id: Optional[int] = Field(default=None, foreign_key="posts.id", primary_key=True)
-    tag_id: Optional[int] = Field(default=None, foreign_key="tags.id", primary_key=True)
+    post_id: Optional[int] = Field(default=None, foreign_key="posts.id", primary_key=True, ondelete="CASCADE")
+    tag_id: Optional[int] = Field(default=None, foreign_key="tags.id", primary_key=True, ondelete="CASCADE")
 
 
 # Association table for many-to-many relationship between pages and tags
 class PageTagLink(SQLModel, table=True):
     __tablename__ = "page_tag_links"  # type: ignore[assignment]
 
-    page_id: Optional[int] = Field(default=None, foreign_key="pages.id", primary_key=True)
-    tag_id: Optional[int] = Field(default=None, foreign_key="tags.id", primary_key=True)
+    page_id: Optional[int] = Field(default=None, foreign_key="pages.id", primary_key=True, ondelete="CASCADE")
+    tag_id: Optional[int] = Field(default=None, foreign_key="tags.id", primary_key=True, ondelete="CASCADE")
 
 
 # Persistent models (stored in database)
@@ -38,15 +73,17 @@ class User(SQLModel, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
     username: str = Field(unique=True, max_length=50)
-    email: str = Field(unique=True, max_length=255, regex=r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+    email: str = Field(unique=True, max_length=255, schema_extra={"pattern": EMAIL_PATTERN})
     password_hash: str = Field(max_length=255)
     first_name: str = Field(max_length=100)
     last_name: str = Field(max_length=100)
     role: UserRole = Field(default=UserRole.EDITOR)
     is_active: bool = Field(default=True)
     last_login: Optional[datetime] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default=None, nullable=False, sa_column_kwargs={"server_default": utcnow()})
+    updated_at: datetime = Field(
+        default=None, nullable=False, sa_column_kwargs={"server_default": utcnow(), "onupdate": utcnow()}
+    )
 
     # Relationships
     posts: List["Post"] = Relationship(back_populates="author")
@@ -61,19 +98,35 @@ class Category(SQLModel, table=True):
     name: str = Field(unique=True, max_length=100)
     slug: str = Field(unique=True, max_length=100)
     description: str = Field(default="", max_length=500)
-    parent_id: Optional[int] = Field(default=None, foreign_key="categories.id")
+    parent_id: Optional[int] = Field(default=None, foreign_key="categories.id", ondelete="SET NULL")
     created_by_id: int = Field(foreign_key="users.id")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default=None, nullable=False, sa_column_kwargs={"server_default": utcnow()})
+    updated_at: datetime = Field(
+        default=None, nullable=False, sa_column_kwargs={"server_default": utcnow(), "onupdate": utcnow()}
+    )
 
     # Relationships
-    created_by: User = Relationship(back_populates="categories")
+    created_by: User = Relationship(back_populates="categories", sa_relationship_kwargs={"lazy": "joined"})
     parent: Optional["Category"] = Relationship(
-        back_populates="children", sa_relationship_kwargs={"remote_side": "Category.id"}
+        back_populates="children", sa_relationship_kwargs={"remote_side": "Category.id", "lazy": "joined"}
     )
-    children: List["Category"] = Relationship(back_populates="parent")
-    posts: List["Post"] = Relationship(back_populates="category")
-    pages: List["Page"] = Relationship(back_populates="category")
+    children: List["Category"] = Relationship(back_populates="parent", sa_relationship_kwargs={"passive_deletes": True})
+    posts: List["Post"] = Relationship(back_populates="category", sa_relationship_kwargs={"passive_deletes": True})
+    pages: List["Page"] = Relationship(back_populates="category", sa_relationship_kwargs={"passive_deletes": True})
+
+    @classmethod
+    def multiple_from_ids(cls, session: Session, ids: List[int]) -> List["Category"]:
+        """Fetch all categories with the given ids in a single query, without loading their relationships.
+
+        Raises ValueError if any of the ids does not exist.
+        """
+        if not ids:
+            return []
+        rows = list(session.exec(strict(select(Category).where(col(Category.id).in_(ids)))).all())
+        missing = set(ids) - {row.id for row in rows}
+        if missing:
+            raise ValueError(f"Unknown category ids: {sorted(missing)}")
+        return rows
 
 
 class Tag(SQLModel, table=True):
@@ -83,15 +136,38 @@ class Tag(SQLModel, table=True):
     name: str = Field(unique=True, max_length=50)
     slug: str = Field(unique=True, max_length=50)
     description: str = Field(default="", max_length=200)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default=None, nullable=False, sa_column_kwargs={"server_default": utcnow()})
 
     # Relationships
-    posts: List["Post"] = Relationship(back_populates="tags", link_model=PostTagLink)
-    pages: List["Page"] = Relationship(back_populates="tags", link_model=PageTagLink)
+    posts: List["Post"] = Relationship(
+        back_populates="tags", link_model=PostTagLink, sa_relationship_kwargs={"passive_deletes": True}
+    )
+    pages: List["Page"] = Relationship(
+        back_populates="tags", link_model=PageTagLink, sa_relationship_kwargs={"passive_deletes": True}
+    )
+
+    @classmethod
+    def multiple_from_ids(cls, session: Session, ids: List[int]) -> List["Tag"]:
+        """Fetch all tags with the given ids in a single query, without loading their relationships.
+
+        Raises ValueError if any of the ids does not exist.
+        """
+        if not ids:
+            return []
+        rows = list(session.exec(strict(select(Tag).where(col(Tag.id).in_(ids)))).all())
+        missing = set(ids) - {row.id for row in rows}
+        if missing:
+            raise ValueError(f"Unknown tag ids: {sorted(missing)}")
+        return rows
 
 
 class Post(SQLModel, table=True):
     __tablename__ = "posts"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_posts_status_pub", "status", "published_at"),
+        Index("ix_posts_featured_pub", "is_featured", "published_at"),
+        Index("ix_posts_author_created", "author_id", "created_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(max_length=200)
@@ -103,22 +179,32 @@ class Post(SQLModel, table=True):
     is_featured: bool = Field(default=False)
     view_count: int = Field(default=0)
     author_id: int = Field(foreign_key="users.id")
-    category_id: Optional[int] = Field(default=None, foreign_key="categories.id")
+    category_id: Optional[int] = Field(default=None, foreign_key="categories.id", ondelete="SET NULL")
     published_at: Optional[datetime] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default=None, nullable=False, sa_column_kwargs={"server_default": utcnow()})
+    updated_at: datetime = Field(
+        default=None, nullable=False, sa_column_kwargs={"server_default": utcnow(), "onupdate": utcnow()}
+    )
     meta_title: Optional[str] = Field(default=None, max_length=200)
     meta_description: Optional[str] = Field(default=None, max_length=300)
-    seo_keywords: List[str] = Field(default=[], sa_column=Column(JSON))
+    seo_keywords: List[str] = Field(default_factory=list, sa_column=Column(JSON))
 
     # Relationships
-    author: User = Relationship(back_populates="posts")
-    category: Optional[Category] = Relationship(back_populates="posts")
-    tags: List[Tag] = Relationship(back_populates="posts", link_model=PostTagLink)
+    author: User = Relationship(back_populates="posts", sa_relationship_kwargs={"lazy": "joined"})
+    category: Optional[Category] = Relationship(back_populates="posts", sa_relationship_kwargs={"lazy": "joined"})
+    tags: List[Tag] = Relationship(
+        back_populates="posts",
+        link_model=PostTagLink,
+        sa_relationship_kwargs={"lazy": "selectin", "passive_deletes": True},
+    )
 
 
 class Page(SQLModel, table=True):
     __tablename__ = "pages"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_pages_status_pub", "status", "published_at"),
+        Index("ix_pages_parent_sort", "parent_id", "sort_order"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(max_length=200)
@@ -129,29 +215,35 @@ class Page(SQLModel, table=True):
     is_homepage: bool = Field(default=False)
     sort_order: int = Field(default=0)
     author_id: int = Field(foreign_key="users.id")
-    category_id: Optional[int] = Field(default=None, foreign_key="categories.id")
-    parent_id: Optional[int] = Field(default=None, foreign_key="pages.id")
+    category_id: Optional[int] = Field(default=None, foreign_key="categories.id", ondelete="SET NULL")
+    parent_id: Optional[int] = Field(default=None, foreign_key="pages.id", ondelete="SET NULL")
     published_at: Optional[datetime] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default=None, nullable=False, sa_column_kwargs={"server_default": utcnow()})
+    updated_at: datetime = Field(
+        default=None, nullable=False, sa_column_kwargs={"server_default": utcnow(), "onupdate": utcnow()}
+    )
     meta_title: Optional[str] = Field(default=None, max_length=200)
     meta_description: Optional[str] = Field(default=None, max_length=300)
-    custom_fields: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    custom_fields: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
 
     # Relationships
-    author: User = Relationship(back_populates="pages")
-    category: Optional[Category] = Relationship(back_populates="pages")
+    author: User = Relationship(back_populates="pages", sa_relationship_kwargs={"lazy": "joined"})
+    category: Optional[Category] = Relationship(back_populates="pages", sa_relationship_kwargs={"lazy": "joined"})
     parent: Optional["Page"] = Relationship(
-        back_populates="children", sa_relationship_kwargs={"remote_side": "Page.id"}
+        back_populates="children", sa_relationship_kwargs={"remote_side": "Page.id", "lazy": "joined"}
+    )
+    children: List["Page"] = Relationship(back_populates="parent", sa_relationship_kwargs={"passive_deletes": True})
+    tags: List[Tag] = Relationship(
+        back_populates="pages",
+        link_model=PageTagLink,
+        sa_relationship_kwargs={"lazy": "selectin", "passive_deletes": True},
     )
-    children: List["Page"] = Relationship(back_populates="parent")
-    tags: List[Tag] = Relationship(back_populates="pages", link_model=PageTagLink)
 
 
 # Non-persistent schemas (for validation, forms, API requests/responses)
 class UserCreate(SQLModel, table=False):
     username: str = Field(max_length=50)
-    email: str = Field(max_length=255)
+    email: str = Field(max_length=255, schema_extra={"pattern": EMAIL_PATTERN})
     password: str = Field(min_length=8, max_length=255)
     first_name: str = Field(max_length=100)
     last_name: str = Field(max_length=100)
@@ -160,7 +252,7 @@ class UserCreate(SQLModel, table=False):
 
 class UserUpdate(SQLModel, table=False):
     username: Optional[str] = Field(default=None, max_length=50)
-    email: Optional[str] = Field(default=None, max_length=255)
+    email: Optional[str] = Field(default=None, max_length=255, schema_extra={"pattern": EMAIL_PATTERN})
     first_name: Optional[str] = Field(default=None, max_length=100)
     last_name: Optional[str] = Field(default=None, max_length=100)
     role: Optional[UserRole] = Field(default=None)
@@ -180,8 +272,8 @@ class UserResponse(SQLModel, table=False):
     last_name: str
     role: UserRole
     is_active: bool
-    last_login: Optional[str] = None
-    created_at: str
+    last_login: Optional[datetime] = None
+    created_at: datetime
 
 
 class CategoryCreate(SQLModel, table=False):
@@ -204,8 +296,8 @@ class CategoryResponse(SQLModel, table=False):
     slug: str
     description: str
     parent_id: Optional[int]
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
 
 
 class TagCreate(SQLModel, table=False):
@@ -225,7 +317,7 @@ class TagResponse(SQLModel, table=False):
     name: str
     slug: str
     description: str
-    created_at: str
+    created_at: datetime
 
 
 class PostCreate(SQLModel, table=False):
@@ -237,10 +329,10 @@ class PostCreate(SQLModel, table=False):
     status: ContentStatus = Field(default=ContentStatus.DRAFT)
     is_featured: bool = Field(default=False)
     category_id: Optional[int] = Field(default=None)
-    tag_ids: List[int] = Field(default=[])
+    tag_ids: List[int] = Field(default_factory=list)
     meta_title: Optional[str] = Field(default=None, max_length=200)
     meta_description: Optional[str] = Field(default=None, max_length=300)
-    seo_keywords: List[str] = Field(default=[])
+    seo_keywords: List[str] = Field(default_factory=list)
 
 
 class PostUpdate(SQLModel, table=False):
@@ -270,9 +362,9 @@ class PostResponse(SQLModel, table=False):
     view_count: int
     author_id: int
     category_id: Optional[int]
-    published_at: Optional[str]
-    created_at: str
-    updated_at: str
+    published_at: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
     meta_title: Optional[str]
     meta_description: Optional[str]
     seo_keywords: List[str]
@@ -288,10 +380,10 @@ class PageCreate(SQLModel, table=False):
     sort_order: int = Field(default=0)
     category_id: Optional[int] = Field(default=None)
     parent_id: Optional[int] = Field(default=None)
-    tag_ids: List[int] = Field(default=[])
+    tag_ids: List[int] = Field(default_factory=list)
     meta_title: Optional[str] = Field(default=None, max_length=200)
     meta_description: Optional[str] = Field(default=None, max_length=300)
-    custom_fields: Dict[str, Any] = Field(default={})
+    custom_fields: Dict[str, Any] = Field(default_factory=dict)
 
 
 class PageUpdate(SQLModel, table=False):
@@ -322,9 +414,9 @@ class PageResponse(SQLModel, table=False):
     author_id: int
     category_id: Optional[int]
     parent_id: Optional[int]
-    published_at: Optional[str]
-    created_at: str
-    updated_at: str
+    published_at: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
     meta_title: Optional[str]
     meta_description: Optional[str]
     custom_fields: Dict[str, Any]
@@ -1,10 +1,12 @@
 from app.database import create_tables
+import app.view_counts
 from nicegui import ui
 
 
 def startup() -> None:
     # this function is called before the first request
     create_tables()
+    app.view_counts.create()
 
     @ui.page("/")
     def index():
@@ -0,0 +1,109 @@
+from logging import getLogger
+from typing import Dict, List, Optional, cast
+
+import redis
+from nicegui import app, run
+from sqlalchemy import bindparam, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import col, select
+
+from app.cache import cache_delete, get_client, post_key
+from app.database import get_session
+from app.models import Post
+
+logger = getLogger(__name__)
+
+# Post views are buffered in a Redis hash (post id -> pending views) and flushed to
+# posts.view_count periodically, so a detail view costs a HINCRBY instead of a row-locking UPDATE.
+VIEWS_KEY = "post:views"
+FLUSH_INTERVAL = 30.0
+
+_INCREMENT_VIEWS = (
+    update(Post)
+    .where(col(Post.id) == bindparam("post_id"))
+    # keep updated_at as it is: a view is not an edit, and the column's onupdate would otherwise bump it
+    .values(view_count=col(Post.view_count) + bindparam("views"), updated_at=col(Post.updated_at))
+)
+
+
+def _apply_views(views: Dict[int, int]) -> List[str]:
+    """Add the given view counts to posts.view_count in a single executemany UPDATE; returns the posts' slugs."""
+    with get_session() as session:
+        session.connection().execute(
+            _INCREMENT_VIEWS, [{"post_id": post_id, "views": count} for post_id, count in views.items()]
+        )
+        slugs = session.exec(select(Post.slug).where(col(Post.id).in_(views))).all()
+        session.commit()
+    return list(slugs)
+
+
+def record_post_view(post_id: int) -> None:
+    """Count one view of a post: buffered in Redis when available, otherwise written straight through."""
+    client = get_client()
+    if client is not None:
+        try:
+            client.hincrby(VIEWS_KEY, str(post_id), 1)
+            return
+        except redis.RedisError as e:
+            logger.warning(f"Buffering view of post {post_id} failed, writing it directly: {e}")
+    _apply_views({post_id: 1})
+
+
+def pending_post_views(post_id: int) -> int:
+    """Views of a post that are buffered in Redis but not yet flushed to the database."""
+    client = get_client()
+    if client is None:
+        return 0
+    try:
+        value = cast(Optional[bytes], client.hget(VIEWS_KEY, str(post_id)))
+    except redis.RedisError as e:
+        logger.warning(f"Reading buffered views of post {post_id} failed: {e}")
+        return 0
+    return int(value) if value is not None else 0
+
+
+def flush_post_views() -> int:
+    """Move all buffered views into the database and return the number of posts updated."""
+    client = get_client()
+    if client is None:
+        return 0
+    try:
+        # read and clear in one MULTI/EXEC so views recorded meanwhile land in a fresh hash
+        pipe = client.pipeline(transaction=True)
+        pipe.hgetall(VIEWS_KEY)
+        pipe.delete(VIEWS_KEY)
+        buffered, _ = pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Reading buffered post views failed: {e}")
+        return 0
+
+    views = {int(post_id): int(count) for post_id, count in buffered.items()}
+    if not views:
+        return 0
+    try:
+        slugs = _apply_views(views)
+    except SQLAlchemyError as e:
+        logger.error(f"Flushing post views failed, putting them back into the buffer: {e}")
+        try:
+            pipe = client.pipeline()
+            for post_id, count in views.items():
+                pipe.hincrby(VIEWS_KEY, str(post_id), count)
+            pipe.execute()
+        except redis.RedisError as redis_error:
+            logger.error(f"Re-buffering post views failed, {sum(views.values())} views lost: {redis_error}")
+        return 0
+    # cached posts carry the view_count from before the flush, while the buffer they were topped up from is now empty
+    cache_delete(*(post_key(slug) for slug in slugs))
+    return len(views)
+
+
+def create() -> None:
+    """Flush buffered views periodically and on shutdown; nothing to do without Redis."""
+    if get_client() is None:
+        return
+
+    async def flush() -> None:
+        await run.io_bound(flush_post_views)
+
+    app.timer(FLUSH_INTERVAL, flush, immediate=False)
+    app.on_shutdown(flush_post_views)
@@ -1,5 +1,11 @@
-from typing import Generator
+import contextlib
+from typing import Callable, ContextManager, Generator, List
+import fakeredis
 import pytest
+from sqlalchemy import event
+from app.cache import set_client
+from app.database import ENGINE, get_session, reset_db
+from app.models import User as AppUser
 from app.startup import startup
 from nicegui.testing import User
 
@@ -10,3 +16,53 @@ pytest_plugins = ["nicegui.testing.plugin"]
 def user(user: User) -> Generator[User, None, None]:
     startup()
     yield user
+
+
+@pytest.fixture
+def clean_db() -> Generator[None, None, None]:
+    reset_db()
+    yield
+    reset_db()
+
+
+@pytest.fixture
+def author_id(clean_db) -> int:
+    """Id of a freshly created user to own test content."""
+    with get_session() as session:
+        author = AppUser(
+            username="author", email="author@example.com", password_hash="x", first_name="A", last_name="Author"
+        )
+        session.add(author)
+        session.commit()
+        session.refresh(author)
+        assert author.id is not None
+        return author.id
+
+
+@pytest.fixture
+def redis_client() -> Generator[fakeredis.FakeRedis, None, None]:
+    """In-memory Redis standing in for APP_REDIS_URL for the duration of a test."""
+    client = fakeredis.FakeRedis()
+    set_client(client)
+    yield client
+    set_client(None)
+
+
+@contextlib.contextmanager
+def _count_queries() -> Generator[List[str], None, None]:
+    """Collect every SQL statement sent to the database while the block runs."""
+    queries: List[str] = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        queries.append(statement)
+
+    event.listen(ENGINE, "before_cursor_execute", on_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(ENGINE, "before_cursor_execute", on_execute)
+
+
+@pytest.fixture
+def count_queries() -> Callable[[], ContextManager[List[str]]]:
+    return _count_queries
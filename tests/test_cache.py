@@ -0,0 +1,48 @@
+import pytest
+
+from app.content_service import (
+    create_category,
+    create_tag,
+    get_post_by_slug,
+    list_categories,
+    list_tags,
+    update_category,
+    update_tag,
+)
+from app.database import get_session
+from app.models import CategoryCreate, CategoryUpdate, ContentStatus, Post, TagCreate, TagUpdate
+
+pytestmark = pytest.mark.sqlmodel
+
+
+def test_writing_tags_invalidates_the_tag_list(clean_db, redis_client):
+    assert list_tags() == []
+
+    tag = create_tag(TagCreate(name="python", slug="python"))
+    assert [t.name for t in list_tags()] == ["python"]
+
+    update_tag(tag.id, TagUpdate(name="py"))
+    assert [t.name for t in list_tags()] == ["py"]
+
+
+def test_writing_categories_invalidates_the_category_list(author_id, redis_client):
+    assert list_categories() == []
+
+    category = create_category(CategoryCreate(name="News", slug="news"), created_by_id=author_id)
+    assert [c.name for c in list_categories()] == ["News"]
+
+    update_category(category.id, CategoryUpdate(name="Updates"))
+    assert [c.name for c in list_categories()] == ["Updates"]
+
+
+def test_slug_lookup_skips_drafts(author_id, redis_client):
+    with get_session() as session:
+        session.add(Post(title="Draft", slug="draft", author_id=author_id))
+        session.add(Post(title="Live", slug="live", status=ContentStatus.PUBLISHED, author_id=author_id))
+        session.commit()
+
+    assert get_post_by_slug("draft") is None
+    assert not redis_client.exists("post:slug:draft")
+    live = get_post_by_slug("live")
+    assert live is not None
+    assert live.title == "Live"
@@ -0,0 +1,35 @@
+import pytest
+
+from app.database import get_session
+from app.models import Page
+
+pytestmark = pytest.mark.sqlmodel
+
+
+def _stored_custom_fields(author_id: int, custom_fields: dict) -> dict:
+    with get_session() as session:
+        page = Page(title="Page", slug="page", author_id=author_id, custom_fields=custom_fields)
+        session.add(page)
+        session.commit()
+        page_id = page.id
+
+    with get_session() as session:
+        stored = session.get(Page, page_id)
+        assert stored is not None
+        return stored.custom_fields
+
+
+def test_nested_custom_fields_round_trip(author_id):
+    custom_fields = {"layout": {"columns": 2, "widgets": ["recent", "tags"]}, "labels": {1: "one", 2: "two"}}
+
+    # non-str keys are written as strings, the same as json.dumps did
+    assert _stored_custom_fields(author_id, custom_fields) == {
+        "layout": {"columns": 2, "widgets": ["recent", "tags"]},
+        "labels": {"1": "one", "2": "two"},
+    }
+
+
+def test_custom_fields_accept_integers_beyond_64_bits(author_id):
+    stored = _stored_custom_fields(author_id, {"counter": 2**64 + 1})
+
+    assert "counter" in stored
@@ -0,0 +1,170 @@
+"""Query-count guards for the content service: eager loading must not regress to N+1."""
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlmodel import select
+
+from app.content_service import (
+    category_ancestors,
+    create_post,
+    list_published_pages,
+    list_published_posts,
+    page_subtree,
+)
+from app.database import get_session
+from app.models import Category, ContentStatus, Page, Post, PostCreate, Tag
+
+pytestmark = pytest.mark.sqlmodel
+
+
+@pytest.fixture
+def content(author_id):
+    """A three-level category chain, five tags, 50 published posts and pages."""
+    with get_session() as session:
+        parent_id = None
+        for level in range(3):
+            category = Category(
+                name=f"level{level}", slug=f"level{level}", created_by_id=author_id, parent_id=parent_id
+            )
+            session.add(category)
+            session.commit()
+            parent_id = category.id
+
+        tags = [Tag(name=f"tag{i}", slug=f"tag{i}") for i in range(5)]
+        session.add_all(tags)
+        for i in range(50):
+            session.add(
+                Post(
+                    title=f"Post {i}",
+                    slug=f"post-{i}",
+                    status=ContentStatus.PUBLISHED,
+                    author_id=author_id,
+                    category_id=parent_id,
+                    tags=tags,
+                )
+            )
+            session.add(
+                Page(
+                    title=f"Page {i}",
+                    slug=f"page-{i}",
+                    status=ContentStatus.PUBLISHED,
+                    author_id=author_id,
+                    category_id=parent_id,
+                    tags=tags,
+                )
+            )
+        session.commit()
+
+        tag_ids = [tag_id for tag_id in session.exec(select(Tag.id)).all() if tag_id is not None]
+        return {"author_id": author_id, "leaf_category_id": parent_id, "tag_ids": tag_ids}
+
+
+def test_list_posts_is_two_queries(content, count_queries):
+    with count_queries() as queries:
+        posts = list_published_posts(limit=50)
+        for post in posts:
+            assert post.author.username == "author"
+            assert post.category is not None
+            assert len(post.tags) == 5
+
+    assert len(posts) == 50
+    assert len(queries) == 2
+
+
+def test_list_pages_is_two_queries(content, count_queries):
+    with count_queries() as queries:
+        pages = list_published_pages(limit=50)
+        for page in pages:
+            assert page.author.username == "author"
+            assert len(page.tags) == 5
+
+    assert len(pages) == 50
+    assert len(queries) == 2
+
+
+def test_list_posts_raises_on_unloaded_relationship(content):
+    posts = list_published_posts(limit=1)
+
+    with pytest.raises(InvalidRequestError):
+        _ = posts[0].author.pages
+
+
+def test_list_posts_leaves_out_long_columns(content, count_queries):
+    with count_queries() as queries:
+        list_published_posts(limit=50)
+
+    assert not any("posts.content" in query or "tags.description" in query for query in queries)
+
+
+def test_category_ancestors_is_one_query(content, count_queries):
+    with count_queries() as queries:
+        chain = category_ancestors(content["leaf_category_id"])
+
+    assert [category.name for category in chain] == ["level0", "level1", "level2"]
+    assert len(queries) == 1
+
+
+def test_category_ancestors_stops_on_a_cycle(content, count_queries):
+    with get_session() as session:
+        root = session.exec(select(Category).where(Category.slug == "level0")).one()
+        root.parent_id = content["leaf_category_id"]
+        session.add(root)
+        session.commit()
+
+    with count_queries() as queries:
+        chain = category_ancestors(content["leaf_category_id"])
+
+    assert sorted(category.name for category in chain) == ["level0", "level1", "level2"]
+    assert len(queries) == 1
+
+
+def test_page_subtree_stops_on_a_cycle(author_id):
+    with get_session() as session:
+        first = Page(title="First", slug="first", author_id=author_id)
+        second = Page(title="Second", slug="second", author_id=author_id, parent=first)
+        session.add_all([first, second])
+        session.commit()
+        first.parent_id = second.id
+        session.add(first)
+        session.commit()
+        first_id = first.id
+        assert first_id is not None
+
+    assert [page.slug for page in page_subtree(first_id)] == ["first", "second"]
+
+
+def test_create_post_looks_up_tags_in_one_query(content, count_queries):
+    with count_queries() as queries:
+        post = create_post(
+            PostCreate(title="New", slug="new", tag_ids=content["tag_ids"]), author_id=content["author_id"]
+        )
+
+    assert post.slug == "new"
+    assert sum(1 for query in queries if "FROM tags" in query) == 1
+
+
+def test_delete_category_leaves_children_to_the_database(content, count_queries):
+    leaf_id = content["leaf_category_id"]
+    with count_queries() as queries:
+        with get_session() as session:
+            category = session.get(Category, leaf_id)
+            assert category is not None
+            session.delete(category)
+            session.commit()
+
+    # one SELECT for the category and one DELETE; ON DELETE SET NULL clears the posts and pages
+    assert len(queries) == 2
+    assert not any(query.lstrip().upper().startswith("UPDATE") for query in queries)
+    with get_session() as session:
+        assert session.exec(select(Post).where(Post.category_id == leaf_id)).first() is None
+        assert session.exec(select(Page).where(Page.category_id == leaf_id)).first() is None
+
+
+def test_create_post_rejects_unknown_tags(content):
+    with pytest.raises(ValueError):
+        create_post(
+            PostCreate(title="New", slug="new", tag_ids=[*content["tag_ids"], 9999]), author_id=content["author_id"]
+        )
+
+    with get_session() as session:
+        assert session.exec(select(Post).where(Post.slug == "new")).first() is None
@@ -0,0 +1,24 @@
+import pytest
+from pydantic import ValidationError
+
+from app.models import UserCreate, UserUpdate
+
+
+def _user_create(email: str) -> UserCreate:
+    return UserCreate(username="author", email=email, password="secret123", first_name="A", last_name="Author")
+
+
+@pytest.mark.parametrize("email", ["nope", "a@b", "author@", "@example.com"])
+def test_user_create_rejects_malformed_email(email):
+    with pytest.raises(ValidationError):
+        _user_create(email)
+
+
+def test_user_create_accepts_valid_email():
+    assert _user_create("author@example.com").email == "author@example.com"
+
+
+def test_user_update_checks_email_only_when_given():
+    assert UserUpdate().email is None
+    with pytest.raises(ValidationError):
+        UserUpdate(email="nope")
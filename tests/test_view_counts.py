@@ -0,0 +1,89 @@
+from datetime import datetime
+
+import pytest
+
+from app.content_service import get_post_by_slug
+from app.database import get_session
+from app.models import ContentStatus, Post
+from app.view_counts import VIEWS_KEY, flush_post_views, record_post_view
+
+pytestmark = pytest.mark.sqlmodel
+
+
+@pytest.fixture
+def post_id(author_id) -> int:
+    with get_session() as session:
+        post = Post(title="Post", slug="post", status=ContentStatus.PUBLISHED, author_id=author_id)
+        session.add(post)
+        session.commit()
+        session.refresh(post)
+        assert post.id is not None
+        return post.id
+
+
+def _stored_views(post_id: int) -> int:
+    with get_session() as session:
+        post = session.get(Post, post_id)
+        assert post is not None
+        return post.view_count
+
+
+def test_recorded_views_reach_the_database(post_id):
+    record_post_view(post_id)
+    record_post_view(post_id)
+
+    # buffered or not, the views are visible right away and end up in posts.view_count after a flush
+    response = get_post_by_slug("post")
+    assert response is not None
+    assert response.view_count == 2
+
+    flush_post_views()
+    assert _stored_views(post_id) == 2
+
+
+def test_views_are_buffered_until_flushed(post_id, redis_client):
+    for _ in range(10):
+        record_post_view(post_id)
+
+    assert _stored_views(post_id) == 0
+    assert redis_client.hget(VIEWS_KEY, str(post_id)) == b"10"
+    response = get_post_by_slug("post")
+    assert response is not None
+    assert response.view_count == 10
+
+    assert flush_post_views() == 1
+    assert _stored_views(post_id) == 10
+    assert not redis_client.exists(VIEWS_KEY)
+
+    # the post cached before the flush must not hide the views that moved into the database
+    response = get_post_by_slug("post")
+    assert response is not None
+    assert response.view_count == 10
+
+
+def test_flushing_views_keeps_updated_at(post_id, redis_client):
+    last_edit = datetime(2024, 1, 1, 12, 0)
+    with get_session() as session:
+        post = session.get(Post, post_id)
+        assert post is not None
+        post.updated_at = last_edit
+        session.add(post)
+        session.commit()
+
+    record_post_view(post_id)
+    assert flush_post_views() == 1
+
+    with get_session() as session:
+        post = session.get(Post, post_id)
+        assert post is not None
+        assert post.view_count == 1
+        assert post.updated_at == last_edit
+
+
+def test_failed_flush_puts_views_back(post_id, redis_client):
+    # more views than posts.view_count can hold: the UPDATE fails in the database
+    redis_client.hset(VIEWS_KEY, str(post_id), 2**31)
+
+    assert flush_post_views() == 0
+    assert redis_client.hget(VIEWS_KEY, str(post_id)) == str(2**31).encode()
+    assert _stored_views(post_id) == 0